@@ -0,0 +1,95 @@
+"""
+import_time.py
+
+Import-time benchmark for the package.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter,
+reports the cumulative import time of the target module, and fails if it
+exceeds a budget or if a heavy dependency (e.g. the Gemini SDK) was pulled
+in at import time.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --module src.orchestrator --budget-ms 40
+"""
+
+from __future__ import annotations
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+
+# Modules that must never be imported just by importing the target.
+HEAVY_MODULES: List[str] = [
+    "google.generativeai",
+    "google.ai.generativelanguage",
+    "grpc",
+]
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_imports(module: str) -> Dict[str, int]:
+    """
+    Import `module` in a fresh interpreter with -X importtime.
+    Returns a mapping of imported module name -> cumulative time (us).
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr}")
+
+    timings: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            cumulative = int(parts[1].strip())
+        except ValueError:
+            continue  # header line
+        timings[parts[2].strip()] = cumulative
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="src.orchestrator")
+    parser.add_argument("--budget-ms", type=float, default=40.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    runs: List[Dict[str, int]] = [measure_imports(args.module) for _ in range(args.runs)]
+    if any(args.module not in r for r in runs):
+        print(f"FAIL: {args.module} not found in -X importtime output")
+        return 1
+    best_us = min(r[args.module] for r in runs)
+    best_ms = best_us / 1000.0
+
+    print(f"{args.module}: best cumulative import time {best_ms:.1f} ms over {args.runs} runs")
+
+    ok = True
+    heavy = sorted({m for r in runs for m in r if m in HEAVY_MODULES})
+    if heavy:
+        print(f"FAIL: heavy modules imported eagerly: {', '.join(heavy)}")
+        ok = False
+    if best_ms > args.budget_ms:
+        print(f"FAIL: import time exceeds budget of {args.budget_ms:.1f} ms")
+        ok = False
+
+    if ok:
+        print("OK")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,9 +5,12 @@ Demo script to run the MeetingOrchestrator on multiple sample transcripts.
 
 - Reuses a single orchestrator so memory builds up across meetings.
 - Prints summary, follow-up message, and evaluation metrics per meeting.
+- Set SPECULATIVE_FOLLOWUP=1 to draft follow-ups speculatively during the
+  refinement loop and print speculation hit rate / latency saved.
 """
 
 from __future__ import annotations
+import logging
 import os
 from typing import List
 
@@ -23,6 +26,11 @@ def load_transcript(path: str) -> str:
 
 
 def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(asctime)s] %(levelname)s - %(message)s",
+    )
+
     # List of transcript files to process.
     # You can add/remove files here.
     transcript_files: List[str] = [
@@ -31,7 +39,8 @@ def main() -> None:
         os.path.join("data", "sample_transcript_2.txt"),     # add your own
     ]
 
-    orchestrator = MeetingOrchestrator()
+    speculative = os.environ.get("SPECULATIVE_FOLLOWUP") == "1"
+    orchestrator = MeetingOrchestrator(speculative_followup=speculative)
 
     for idx, path in enumerate(transcript_files, start=1):
         print("\n" + "=" * 80)
@@ -55,6 +64,10 @@ def main() -> None:
         print("\n--- EVALUATION METRICS ---")
         print(result.get("evaluation", {}))
 
+        if "speculation" in result:
+            print("\n--- SPECULATIVE FOLLOW-UP ---")
+            print(result["speculation"])
+
         # Optionally show trend insights once multiple meetings have run
         if idx > 1:
             print("\n--- TREND INSIGHTS (AFTER THIS MEETING) ---")
@@ -62,6 +75,10 @@ def main() -> None:
             print("Overloaded people:", result.get("overloaded_people", []))
             print("Themes:", result.get("themes", []))
 
+    if speculative:
+        print("\n--- SPECULATION REPORT ---")
+        print(orchestrator.speculation_report())
+
 
 if __name__ == "__main__":
     main()
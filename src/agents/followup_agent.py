@@ -14,6 +14,9 @@ The output is a GitHub/Kaggle-friendly Markdown email:
 - Action items as a Markdown table
 - Risks / Themes
 - Closing
+
+It can also revise an existing draft, regenerating only the sections whose
+inputs changed (used by the orchestrator's speculative follow-up mode).
 """
 
 from __future__ import annotations
@@ -54,21 +57,39 @@ Rules:
 """
 
 
+REVISION_PROMPT = """
+You are a Follow-Up Communication Agent revising an email you already drafted.
+
+You are given:
+- The current draft (GitHub-flavored Markdown).
+- The names of the sections that are now out of date.
+- The updated structured data (summary, actions, risks, themes).
+
+Rules:
+- Rewrite ONLY the listed sections using the updated data, keeping the same
+  Markdown structure (headings, table columns, bullet style).
+- Keep every other part of the draft exactly as it is, word for word.
+- Return the complete revised email.
+- Do NOT return JSON.
+- Do NOT wrap the output in backticks or code fences.
+"""
+
+
+def _build_payload(context: Dict[str, Any]) -> Dict[str, Any]:
+    """Collect the structured inputs the follow-up email is written from."""
+    return {
+        "summary": context.get("summary", ""),
+        "actions": context.get("actions", []),
+        "risks": context.get("global_risks", []),
+        "themes": context.get("themes", []),
+    }
+
+
 class FollowupAgent(BaseAgent):
     """Creates a human-readable, Markdown-formatted follow-up email."""
 
     def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        summary: str = context.get("summary", "")
-        actions: List[Dict[str, Any]] = context.get("actions", [])
-        risks: List[str] = context.get("global_risks", [])
-        themes: List[str] = context.get("themes", [])
-
-        payload = {
-            "summary": summary,
-            "actions": actions,
-            "risks": risks,
-            "themes": themes,
-        }
+        payload = _build_payload(context)
 
         user_msg = (
             "Use the following structured information to write the Markdown email.\n\n"
@@ -78,3 +99,25 @@ class FollowupAgent(BaseAgent):
         text = self.llm.chat(SYSTEM_PROMPT, [{"role": "user", "content": user_msg}])
         context["followup_message"] = text
         return context
+
+    def revise(
+        self,
+        context: Dict[str, Any],
+        draft: str,
+        sections: List[str],
+    ) -> Dict[str, Any]:
+        """
+        Update `draft` in place of a full rewrite, regenerating only the
+        named sections (e.g. "Action Items", "Risks & Themes").
+        """
+        payload = _build_payload(context)
+
+        user_msg = (
+            f"SECTIONS TO REWRITE: {', '.join(sections)}\n\n"
+            f"UPDATED DATA:\n{json.dumps(payload, indent=2)}\n\n"
+            f"CURRENT DRAFT:\n{draft}"
+        )
+
+        text = self.llm.chat(REVISION_PROMPT, [{"role": "user", "content": user_msg}])
+        context["followup_message"] = text
+        return context
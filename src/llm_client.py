@@ -7,21 +7,35 @@ IMPORTANT:
 - Do NOT put your API key in this file.
 - Set GEMINI_API_KEY using an environment variable in Kaggle or your local machine.
 - This file is safe to commit to GitHub.
+- The Gemini SDK is imported lazily on the first `chat` call, so importing
+  this module (or anything that depends on it) stays cheap.
 """
 
 import os
-from typing import List, Dict
-import google.generativeai as genai
+from typing import Any, List, Dict, Optional
 
 
 class LLMClient:
     """
     Simple wrapper around a Gemini model for multi-agent calls.
+
+    The SDK import, API key lookup and model construction are deferred
+    until the first `chat` call.
     """
 
     def __init__(self, model_name: str = "gemini-2.5-flash"):
         self.model_name = model_name
+        self._model: Optional[Any] = None
+
+    @property
+    def model(self) -> Any:
+        """The underlying Gemini model, created on first access."""
+        if self._model is None:
+            self._model = self._create_model()
+        return self._model
 
+    def _create_model(self) -> Any:
+        """Import the Gemini SDK, configure it and build the model instance."""
         # Configure Gemini with API key FROM ENVIRONMENT VARIABLE ONLY.
         api_key = os.environ.get("GEMINI_API_KEY")
 
@@ -32,10 +46,12 @@ class LLMClient:
                 "os.environ['GEMINI_API_KEY'] = 'your-key-here'"
             )
 
+        import google.generativeai as genai
+
         genai.configure(api_key=api_key)
 
         # Create a model instance.
-        self.model = genai.GenerativeModel(self.model_name)
+        return genai.GenerativeModel(self.model_name)
 
     def chat(self, system_prompt: str, messages: List[Dict[str, str]]) -> str:
         """
@@ -6,27 +6,57 @@ Coordinates the multi-agent system:
 - action extraction
 - quality loop
 - trend analysis using memory
-- follow-up generation
+- follow-up generation (optionally drafted speculatively, see below)
 - simple evaluation metrics (observability)
+
+Importing this module is kept cheap: the LLM SDK is only loaded on the
+first `chat` call, agent modules are imported when an agent is first
+used, and logging configuration is left to the entry point (see main.py).
+
+Speculative follow-up (opt-in via `speculative_followup=True`): when the
+first refinement pass does not reach the quality threshold, trend analysis
+and a follow-up draft are started in the background from the first-pass
+actions while the final refinement pass runs. The draft is kept if the
+refined actions/risks did not change materially; otherwise only the stale
+sections are regenerated. Hit rate and latency saved are reported.
 """
 
 from __future__ import annotations
-from typing import Dict, Any, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
+import copy
+import difflib
 import logging
+import re
 import time
 
 from src.llm_client import LLMClient
 from src.memory_store import InMemoryMeetingStore
-from src.agents.transcript_analyzer import TranscriptAnalyzerAgent
-from src.agents.action_extractor import ActionItemExtractorAgent
-from src.agents.priority_risk_agent import PriorityRiskAgent
-from src.agents.trend_agent import TrendAgent
-from src.agents.followup_agent import FollowupAgent
 
+if TYPE_CHECKING:
+    from src.agents.transcript_analyzer import TranscriptAnalyzerAgent
+    from src.agents.action_extractor import ActionItemExtractorAgent
+    from src.agents.priority_risk_agent import PriorityRiskAgent
+    from src.agents.trend_agent import TrendAgent
+    from src.agents.followup_agent import FollowupAgent
+
+
+logger = logging.getLogger(__name__)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(asctime)s] %(levelname)s - %(message)s",
+# Context keys written by TrendAgent.
+TREND_KEYS = ("recurring_blockers", "overloaded_people", "themes", "trend_insights_raw")
+
+# Minimum difflib ratio for two texts to count as the same item when
+# deciding whether a speculative follow-up draft is still valid.
+TEXT_SIMILARITY_THRESHOLD = 0.9
+
+# Words that flip an item's meaning; adding or removing one is always material.
+NEGATION_WORDS = frozenset(
+    {
+        "not", "no", "never", "none", "without", "cannot",
+        "cancel", "cancels", "cancelled", "canceled", "cancelling", "canceling", "cancellation",
+        "stop", "drop", "skip", "avoid", "postpone", "postponed",
+    }
 )
 
 
@@ -36,18 +66,68 @@ class MeetingOrchestrator:
 
     This class represents the "multi-agent system" from the perspective
     of the competition rubric.
+
+    Sub-agents are created on demand the first time they are needed.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, speculative_followup: bool = False) -> None:
         self.llm = LLMClient()
         self.memory = InMemoryMeetingStore()
+        self.speculative_followup = speculative_followup
+
+        # Running totals for speculative follow-up drafting.
+        self.speculation_stats: Dict[str, Any] = {
+            "attempts": 0,
+            "hits": 0,
+            "latency_saved_sec": 0.0,
+        }
+
+        # Sub-agents (created lazily by the properties below)
+        self._transcript_agent: Optional[TranscriptAnalyzerAgent] = None
+        self._action_agent: Optional[ActionItemExtractorAgent] = None
+        self._priority_agent: Optional[PriorityRiskAgent] = None
+        self._trend_agent: Optional[TrendAgent] = None
+        self._followup_agent: Optional[FollowupAgent] = None
+
+    @property
+    def transcript_agent(self) -> TranscriptAnalyzerAgent:
+        if self._transcript_agent is None:
+            from src.agents.transcript_analyzer import TranscriptAnalyzerAgent
+
+            self._transcript_agent = TranscriptAnalyzerAgent(self.llm, "transcript_analyzer")
+        return self._transcript_agent
+
+    @property
+    def action_agent(self) -> ActionItemExtractorAgent:
+        if self._action_agent is None:
+            from src.agents.action_extractor import ActionItemExtractorAgent
+
+            self._action_agent = ActionItemExtractorAgent(self.llm, "action_extractor")
+        return self._action_agent
+
+    @property
+    def priority_agent(self) -> PriorityRiskAgent:
+        if self._priority_agent is None:
+            from src.agents.priority_risk_agent import PriorityRiskAgent
+
+            self._priority_agent = PriorityRiskAgent(self.llm, "priority_risk")
+        return self._priority_agent
 
-        # Sub-agents
-        self.transcript_agent = TranscriptAnalyzerAgent(self.llm, "transcript_analyzer")
-        self.action_agent = ActionItemExtractorAgent(self.llm, "action_extractor")
-        self.priority_agent = PriorityRiskAgent(self.llm, "priority_risk")
-        self.trend_agent = TrendAgent(self.llm, "trend_insights", self.memory)
-        self.followup_agent = FollowupAgent(self.llm, "followup")
+    @property
+    def trend_agent(self) -> TrendAgent:
+        if self._trend_agent is None:
+            from src.agents.trend_agent import TrendAgent
+
+            self._trend_agent = TrendAgent(self.llm, "trend_insights", self.memory)
+        return self._trend_agent
+
+    @property
+    def followup_agent(self) -> FollowupAgent:
+        if self._followup_agent is None:
+            from src.agents.followup_agent import FollowupAgent
+
+            self._followup_agent = FollowupAgent(self.llm, "followup")
+        return self._followup_agent
 
     def process_meeting(self, transcript: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -61,28 +141,73 @@ class MeetingOrchestrator:
             "metadata": metadata,
         }
 
-        logging.info("Starting transcript analysis...")
+        logger.info("Starting transcript analysis...")
         context = self.transcript_agent.run(context)
 
-        logging.info("Extracting action items...")
+        logger.info("Extracting action items...")
         context = self.action_agent.run(context)
 
         # Loop: refine until quality_score >= threshold or max passes reached.
         max_passes = 2
         desired_quality = 85
-        for i in range(max_passes):
-            logging.info("Priority & risk refinement pass %s...", i + 1)
-            context = self.priority_agent.run(context)
-            score = context.get("quality_score", 0)
-            logging.info("Quality score after pass %s: %s", i + 1, score)
-            if score >= desired_quality:
-                break
+        executor: Optional[ThreadPoolExecutor] = None
+        draft_future: Optional[Future] = None
+        speculation_start = 0.0
+        try:
+            for i in range(max_passes):
+                if self.speculative_followup and i > 0 and i == max_passes - 1:
+                    # Draft the follow-up from the current actions while the
+                    # final refinement pass runs.
+                    logger.info("Speculatively drafting follow-up from pass %s actions...", i)
+                    speculation_start = time.time()
+                    executor = ThreadPoolExecutor(max_workers=1)
+                    draft_future = executor.submit(self._draft_followup, copy.deepcopy(context))
+
+                logger.info("Priority & risk refinement pass %s...", i + 1)
+                pass_start = time.time()
+                context = self.priority_agent.run(context)
+                final_pass_sec = time.time() - pass_start
+                score = context.get("quality_score", 0)
+                logger.info("Quality score after pass %s: %s", i + 1, score)
+                if score >= desired_quality:
+                    break
 
-        logging.info("Computing trend insights across meetings...")
-        context = self.trend_agent.run(context)
+            draft: Optional[Dict[str, Any]] = None
+            if draft_future is not None:
+                wait_start = time.time()
+                try:
+                    draft = draft_future.result()
+                except Exception as exc:
+                    # Speculation is best-effort: fall back to the sequential path.
+                    logger.warning(
+                        "Speculative follow-up draft failed (%r); falling back to sequential path.",
+                        exc,
+                    )
+                    self._record_speculation(
+                        context,
+                        hit=False,
+                        stale_sections=[],
+                        saved=-(time.time() - wait_start),
+                        error=repr(exc),
+                    )
 
-        logging.info("Generating follow-up message...")
-        context = self.followup_agent.run(context)
+            if draft is not None:
+                context = self._reconcile_speculation(
+                    context, draft, speculation_start, final_pass_sec
+                )
+            else:
+                logger.info("Computing trend insights across meetings...")
+                context = self.trend_agent.run(context)
+
+                logger.info("Generating follow-up message...")
+                context = self.followup_agent.run(context)
+        finally:
+            if draft_future is not None:
+                # Only prevents a draft that has not started yet; a draft already
+                # running keeps going in the background and its result is dropped.
+                draft_future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
 
         # Persist current meeting into memory
         self.memory.add_meeting(
@@ -95,9 +220,110 @@ class MeetingOrchestrator:
         context["evaluation"] = self._evaluate_meeting(context)
         context["processing_time_sec"] = round(time.time() - start_time, 3)
 
-        logging.info("Meeting processing completed in %ss", context["processing_time_sec"])
+        logger.info("Meeting processing completed in %ss", context["processing_time_sec"])
         return context
 
+    def _draft_followup(self, draft: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run trend analysis and the follow-up agent on a snapshot of the
+        context. Executed in a background thread during the final pass.
+        """
+        start = time.time()
+        draft = self.trend_agent.run(draft)
+        draft = self.followup_agent.run(draft)
+        draft["draft_time_sec"] = time.time() - start
+        return draft
+
+    def _reconcile_speculation(
+        self,
+        context: Dict[str, Any],
+        draft: Dict[str, Any],
+        speculation_start: float,
+        final_pass_sec: float,
+    ) -> Dict[str, Any]:
+        """
+        Compare the refined actions/risks against the draft's inputs.
+        Keep the draft if nothing material changed; otherwise refresh trend
+        insights if needed and regenerate only the affected sections.
+
+        A change is material when:
+        - the number of actions differs, or the multiset of
+          (owner, due_date, priority) across actions differs;
+        - actions, risks or themes cannot be paired one-to-one with draft
+          items whose text is similar (see `_similar`): any change in numbers
+          or negation words ("not", "cancel", "don't", ...) is material, and
+          otherwise the difflib ratio must reach TEXT_SIMILARITY_THRESHOLD.
+        Case, whitespace, ordering and light rewording are ignored, since
+        PriorityRiskAgent rewrites this text on every pass.
+        """
+        actions_changed = _actions_changed(context.get("actions", []), draft.get("actions", []))
+        risks_changed = _texts_changed(context.get("global_risks", []), draft.get("global_risks", []))
+
+        if actions_changed:
+            # Trend insights depend on the current actions, so recompute them.
+            logger.info("Refined actions changed; recomputing trend insights...")
+            context = self.trend_agent.run(context)
+        else:
+            for key in TREND_KEYS:
+                context[key] = draft.get(key)
+
+        stale_sections: List[str] = []
+        if actions_changed:
+            stale_sections.append("Action Items")
+        themes_changed = _texts_changed(context.get("themes", []), draft.get("themes", []))
+        if risks_changed or themes_changed:
+            stale_sections.append("Risks & Themes")
+
+        hit = not stale_sections
+        if hit:
+            logger.info("Speculative follow-up draft kept (no material changes).")
+            context["followup_message"] = draft.get("followup_message", "")
+        else:
+            logger.info("Regenerating stale follow-up sections: %s", ", ".join(stale_sections))
+            context = self.followup_agent.revise(
+                context, draft.get("followup_message", ""), stale_sections
+            )
+
+        # Sequential cost would have been the final pass plus trend + follow-up.
+        elapsed = time.time() - speculation_start
+        saved = final_pass_sec + draft.get("draft_time_sec", 0.0) - elapsed
+
+        self._record_speculation(context, hit=hit, stale_sections=stale_sections, saved=saved)
+        return context
+
+    def _record_speculation(
+        self,
+        context: Dict[str, Any],
+        hit: bool,
+        stale_sections: List[str],
+        saved: float,
+        error: Optional[str] = None,
+    ) -> None:
+        """Update running speculation totals and the per-meeting entry."""
+        self.speculation_stats["attempts"] += 1
+        self.speculation_stats["hits"] += int(hit)
+        self.speculation_stats["latency_saved_sec"] = round(
+            self.speculation_stats["latency_saved_sec"] + saved, 3
+        )
+
+        context["speculation"] = {
+            "hit": hit,
+            "stale_sections": stale_sections,
+            "latency_saved_sec": round(saved, 3),
+        }
+        if error is not None:
+            context["speculation"]["error"] = error
+
+    def speculation_report(self) -> Dict[str, Any]:
+        """Aggregate speculative follow-up metrics across processed meetings."""
+        attempts = self.speculation_stats["attempts"]
+        return {
+            **self.speculation_stats,
+            "hit_rate_pct": round((self.speculation_stats["hits"] / attempts) * 100, 1)
+            if attempts
+            else 0.0,
+        }
+
     @staticmethod
     def _evaluate_meeting(context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -118,3 +344,85 @@ class MeetingOrchestrator:
             "actions_with_owner_pct": round((with_owner / total) * 100, 1) if total else 0.0,
             "high_priority_actions": high_priority,
         }
+
+
+def _normalize_text(value: Any) -> str:
+    """Lower-case a value and collapse its whitespace."""
+    return " ".join(str(value or "").lower().split())
+
+
+def _negations(text: str) -> List[str]:
+    """Sorted negation words (including n't contractions) found in `text`."""
+    words = re.findall(r"[a-z0-9']+", text)
+    return sorted(w for w in words if w in NEGATION_WORDS or w.endswith("n't"))
+
+
+def _similar(a: Any, b: Any) -> bool:
+    """
+    True if two texts differ only by light rewording: same numbers, same
+    negation words, and a difflib ratio of at least TEXT_SIMILARITY_THRESHOLD.
+    """
+    a_text, b_text = _normalize_text(a), _normalize_text(b)
+    if a_text == b_text:
+        return True
+    if sorted(re.findall(r"\d+", a_text)) != sorted(re.findall(r"\d+", b_text)):
+        return False
+    if _negations(a_text) != _negations(b_text):
+        return False
+    return difflib.SequenceMatcher(None, a_text, b_text).ratio() >= TEXT_SIMILARITY_THRESHOLD
+
+
+def _texts_changed(current: List[Any], draft: List[Any]) -> bool:
+    """
+    Materially different if the counts differ or the items cannot be paired
+    one-to-one with sufficiently similar draft items.
+    """
+    current = list(current or [])
+    remaining = list(draft or [])
+    if len(current) != len(remaining):
+        return True
+    for item in current:
+        match = next((i for i, other in enumerate(remaining) if _similar(item, other)), None)
+        if match is None:
+            return True
+        remaining.pop(match)
+    return False
+
+
+def _action_key(action: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Structured fields of an action that must match exactly."""
+    return (
+        _normalize_text(action.get("owner")),
+        _normalize_text(action.get("due_date")),
+        _normalize_text(action.get("priority")),
+    )
+
+
+def _actions_changed(current: List[Dict[str, Any]], draft: List[Dict[str, Any]]) -> bool:
+    """
+    Materially different if the action count or the multiset of
+    (owner, due_date, priority) differs, or a description was reworded
+    beyond the similarity threshold.
+    """
+    current = [a for a in current or [] if isinstance(a, dict)]
+    remaining = [a for a in draft or [] if isinstance(a, dict)]
+    if len(current) != len(remaining):
+        return True
+    if sorted(_action_key(a) for a in current) != sorted(_action_key(a) for a in remaining):
+        return True
+
+    # Pair each action one-to-one with an unmatched draft action.
+    for action in current:
+        match = next(
+            (
+                i
+                for i, other in enumerate(remaining)
+                if _action_key(other) == _action_key(action)
+                and _similar(action.get("description"), other.get("description"))
+            ),
+            None,
+        )
+        if match is None:
+            return True
+        remaining.pop(match)
+    return False
@@ -0,0 +1,35 @@
+"""
+test_import_time.py
+
+Checks that importing the orchestrator (and constructing it) does not pull
+in the Gemini SDK. Runs in a fresh interpreter so other tests cannot
+pre-populate sys.modules.
+"""
+
+from __future__ import annotations
+import os
+import subprocess
+import sys
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHECK_SCRIPT = """
+import sys
+import src.orchestrator
+from src.orchestrator import MeetingOrchestrator
+MeetingOrchestrator()
+heavy = sorted(m for m in sys.modules if m == "google.generativeai" or m.startswith("google.generativeai."))
+print(",".join(heavy))
+"""
+
+
+def test_orchestrator_does_not_import_gemini_sdk() -> None:
+    proc = subprocess.run(
+        [sys.executable, "-c", CHECK_SCRIPT],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == ""
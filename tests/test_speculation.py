@@ -0,0 +1,180 @@
+"""
+test_speculation.py
+
+Behavior checks for speculative follow-up drafting in MeetingOrchestrator,
+using a stub LLM client instead of Gemini.
+"""
+
+from __future__ import annotations
+import json
+from typing import Any, Dict, List, Optional
+
+from src.agents.followup_agent import REVISION_PROMPT
+from src.orchestrator import MeetingOrchestrator, _actions_changed, _texts_changed
+
+
+FIRST_PASS_ACTIONS = [
+    {"description": "Send the Q3 budget draft to finance", "owner": "Alice", "due_date": "Friday", "priority": "High"},
+    {"description": "Book the venue for the offsite", "owner": "Bob", "due_date": "TBD", "priority": "Low"},
+]
+FIRST_PASS_RISKS = ["Budget approval may slip past the deadline"]
+
+
+class StubLLM:
+    """Routes calls by system prompt and returns canned responses."""
+
+    def __init__(
+        self,
+        second_pass_actions: Optional[List[Dict[str, Any]]] = None,
+        second_pass_risks: Optional[List[str]] = None,
+        fail_first_followup: bool = False,
+        first_pass_score: int = 50,
+    ) -> None:
+        self.second_pass_actions = second_pass_actions or FIRST_PASS_ACTIONS
+        self.second_pass_risks = second_pass_risks or FIRST_PASS_RISKS
+        self.fail_first_followup = fail_first_followup
+        self.first_pass_score = first_pass_score
+        self.priority_calls = 0
+        self.revisions: List[str] = []
+
+    def chat(self, system_prompt: str, messages: List[Dict[str, str]]) -> str:
+        if "Transcript Analyzer" in system_prompt:
+            return json.dumps({"topics": [], "decisions": [], "summary": "Planning meeting."})
+        if "Action Item Extraction" in system_prompt:
+            return json.dumps(FIRST_PASS_ACTIONS)
+        if "Priority & Risk" in system_prompt:
+            self.priority_calls += 1
+            first = self.priority_calls == 1
+            return json.dumps(
+                {
+                    "actions": FIRST_PASS_ACTIONS if first else self.second_pass_actions,
+                    "global_risks": FIRST_PASS_RISKS if first else self.second_pass_risks,
+                    "quality_score": self.first_pass_score if first else 50,
+                }
+            )
+        if "Trend Insight" in system_prompt:
+            return json.dumps({"recurring_blockers": [], "overloaded_people": [], "themes": ["Budget"]})
+        if system_prompt == REVISION_PROMPT:
+            self.revisions.append(messages[0]["content"])
+            return "REVISED"
+        if "Follow-Up Communication" in system_prompt:
+            if self.fail_first_followup:
+                self.fail_first_followup = False
+                raise RuntimeError("boom")
+            return "DRAFT"
+        raise AssertionError(f"Unexpected prompt: {system_prompt[:40]}")
+
+
+def run_meeting(llm: StubLLM, speculative: bool = True) -> Dict[str, Any]:
+    orchestrator = MeetingOrchestrator(speculative_followup=speculative)
+    orchestrator.llm = llm
+    result = orchestrator.process_meeting("transcript", {"meeting_id": "m1"})
+    result["report"] = orchestrator.speculation_report()
+    return result
+
+
+def test_hit_keeps_draft_despite_rewording() -> None:
+    reworded = [
+        dict(FIRST_PASS_ACTIONS[0], description="Send the Q3 budget draft over to finance"),
+        FIRST_PASS_ACTIONS[1],
+    ]
+    llm = StubLLM(second_pass_actions=reworded, second_pass_risks=["Budget approval might slip past the deadline"])
+    result = run_meeting(llm)
+
+    assert result["followup_message"] == "DRAFT"
+    assert result["speculation"]["hit"] is True
+    assert result["speculation"]["stale_sections"] == []
+    assert llm.revisions == []
+    assert result["report"]["hit_rate_pct"] == 100.0
+
+
+def test_changed_action_marks_action_items_stale() -> None:
+    reassigned = [dict(FIRST_PASS_ACTIONS[0], owner="Carol"), FIRST_PASS_ACTIONS[1]]
+    llm = StubLLM(second_pass_actions=reassigned)
+    result = run_meeting(llm)
+
+    assert result["followup_message"] == "REVISED"
+    assert result["speculation"]["hit"] is False
+    assert result["speculation"]["stale_sections"] == ["Action Items"]
+    assert len(llm.revisions) == 1
+    assert "SECTIONS TO REWRITE: Action Items" in llm.revisions[0]
+
+
+def test_changed_risks_mark_risks_and_themes_stale() -> None:
+    llm = StubLLM(second_pass_risks=FIRST_PASS_RISKS + ["Venue may be unavailable"])
+    result = run_meeting(llm)
+
+    assert result["followup_message"] == "REVISED"
+    assert result["speculation"]["stale_sections"] == ["Risks & Themes"]
+    assert "SECTIONS TO REWRITE: Risks & Themes" in llm.revisions[0]
+
+
+def test_failed_draft_falls_back_to_sequential_path() -> None:
+    llm = StubLLM(fail_first_followup=True)
+    result = run_meeting(llm)
+
+    assert result["followup_message"] == "DRAFT"
+    assert result["themes"] == ["Budget"]
+    assert result["speculation"]["hit"] is False
+    assert "boom" in result["speculation"]["error"]
+    assert result["report"]["attempts"] == 1
+    assert result["report"]["hits"] == 0
+
+
+def test_sequential_path_when_speculation_disabled() -> None:
+    llm = StubLLM(second_pass_actions=[dict(FIRST_PASS_ACTIONS[0], owner="Carol"), FIRST_PASS_ACTIONS[1]])
+    result = run_meeting(llm, speculative=False)
+
+    assert result["followup_message"] == "DRAFT"
+    assert "speculation" not in result
+    assert llm.priority_calls == 2
+    assert llm.revisions == []
+    assert result["report"]["attempts"] == 0
+
+
+def test_no_speculation_when_first_pass_meets_quality() -> None:
+    llm = StubLLM(first_pass_score=90)
+    result = run_meeting(llm)
+
+    assert result["followup_message"] == "DRAFT"
+    assert "speculation" not in result
+    assert llm.priority_calls == 1
+    assert result["report"]["attempts"] == 0
+
+
+def test_diff_helpers() -> None:
+    assert not _actions_changed(FIRST_PASS_ACTIONS, list(reversed(FIRST_PASS_ACTIONS)))
+    assert _actions_changed(FIRST_PASS_ACTIONS, FIRST_PASS_ACTIONS[:1])
+    assert _actions_changed(
+        FIRST_PASS_ACTIONS,
+        [dict(FIRST_PASS_ACTIONS[0], description="Cancel the offsite entirely"), FIRST_PASS_ACTIONS[1]],
+    )
+    assert not _texts_changed(["Budget may slip"], ["budget  MAY slip."])
+    assert _texts_changed(["Budget may slip"], ["Hiring freeze announced"])
+
+    # Changes that reverse meaning, swap numbers or add/remove a negation
+    # are material even when most of the wording is shared.
+    pairs = [
+        ("Book the venue for the offsite", "Cancel the venue booking for the offsite"),
+        ("Send the Q3 budget draft to finance", "Send the Q4 budget draft to legal"),
+        ("Budget approval may slip past the deadline", "Budget approval will not slip past the deadline"),
+        ("Do not ship the release on Friday", "Ship the release on Friday"),
+        ("Don't ship the release on Friday", "Ship the release on Friday"),
+    ]
+    for before, after in pairs:
+        assert _texts_changed([after], [before]), (before, after)
+        assert _actions_changed(
+            [dict(FIRST_PASS_ACTIONS[0], description=after)],
+            [dict(FIRST_PASS_ACTIONS[0], description=before)],
+        ), (before, after)
+
+
+def test_texts_are_paired_one_to_one() -> None:
+    assert _texts_changed(
+        ["Budget may slip", "Budget may slip badly"],
+        ["Budget may slip", "Hiring freeze announced"],
+    )
+    assert not _texts_changed(
+        ["Hiring freeze announced", "Budget may slip"],
+        ["Budget may slip", "Hiring freeze announced"],
+    )